@@ -8,6 +8,23 @@ from pathlib import Path
 
 from microframe import TemplateEngine
 
+_HTML_COMPONENT_TEMPLATE = """<div class="{name}">
+  {{{{ slot }}}}
+</div>
+"""
+
+_PY_COMPONENT_TEMPLATE = """from microframe import UIComponent, ui_register
+
+
+@ui_register
+class {class_name}(UIComponent):
+    def render(self):
+        return f'<div class="{name}">{{self.props.get("slot", "")}}</div>'
+"""
+
+# Pages rendered at once by `build`; keeps MFE fetches within the HTTP pool limits.
+_BUILD_CONCURRENCY = 8
+
 
 def _load_ctx(path: str) -> dict:
     if path == "-":
@@ -22,7 +39,8 @@ async def _cmd_render(args):
         ctx = _load_ctx(args.ctx)
 
     engine = TemplateEngine(directory=args.dir, debug=False, enable_minify=not args.no_minify)
-    html = await engine.render(args.template, ctx)
+    async with engine:
+        html = await engine.render(args.template, ctx)
 
     if args.out:
         Path(args.out).write_text(html)
@@ -48,14 +66,34 @@ async def _cmd_build(args):
         print(f"No templates found in {templates_dir}", file=sys.stderr)
         return
 
-    for name in templates:
-        if not name.endswith((".html", ".htm", ".xml", ".svg")):
-            continue
-        html = await engine.render(name, ctx)
+    pages = [name for name in templates if name.endswith((".html", ".htm", ".xml", ".svg"))]
+    semaphore = asyncio.Semaphore(_BUILD_CONCURRENCY)
+
+    async def build_page(name: str) -> Path:
+        async with semaphore:
+            html = await engine.render(name, ctx)
         dest = Path(out_dir) / name
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_text(html)
-        print(f"  built  {name}  ->  {dest}")
+        return dest
+
+    # A failing page must not stop the others (nor close the MFE pool under them):
+    # collect every result, then report in template order.
+    async with engine:
+        results = await asyncio.gather(
+            *(build_page(name) for name in pages), return_exceptions=True
+        )
+
+    failed = 0
+    for name, result in zip(pages, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            print(f"  failed {name}: {result}", file=sys.stderr)
+        else:
+            print(f"  built  {name}  ->  {result}")
+
+    if failed:
+        sys.exit(f"{failed} page(s) failed to build")
 
 
 def _cmd_scaffold(args):
@@ -73,30 +111,20 @@ def _scaffold_html_component(name: str, templates_dir: str):
         print(f"exists  {dest}", file=sys.stderr)
         return
 
-    content = f"""<div class="{name}">
-  {{{{ slot }}}}
-</div>
-"""
-    dest.write_text(content)
+    dest.write_text(_HTML_COMPONENT_TEMPLATE.format(name=name))
     print(f"created  {dest}")
 
 
 def _scaffold_py_component(name: str, templates_dir: str):
     dest = Path(templates_dir) / f"{name}.py"
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
     if dest.exists():
         print(f"exists  {dest}", file=sys.stderr)
         return
 
     class_name = "".join(word.capitalize() for word in name.replace("-", "_").split("_"))
-    content = f"""from microframe import UIComponent, ui_register
-
-
-@ui_register
-class {class_name}(UIComponent):
-    def render(self):
-        return f'<div class="{name}">{{{{ self.props.get("slot", "") }}}}</div>'
-"""
-    dest.write_text(content)
+    dest.write_text(_PY_COMPONENT_TEMPLATE.format(name=name, class_name=class_name))
     print(f"created  {dest}")
 
 
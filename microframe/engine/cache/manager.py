@@ -1,5 +1,6 @@
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Optional
 
 
@@ -36,37 +37,49 @@ class CacheBackend(ABC):
 class CacheManager(CacheBackend):
     """In-memory cache with TTL support.
 
-    Default backend used by TemplateEngine. Stores values in a dict
-    with insertion timestamps for expiration checks.
+    Default backend used by TemplateEngine. Each entry is stored as a
+    single ``(timestamp, value)`` tuple so a lookup costs one dict access.
+    With ``max_size`` set, the least recently used entry is evicted once
+    the cache is full.
 
     Usage:
-        cache = CacheManager()
+        cache = CacheManager(max_size=1000)
         cache.set("mykey", "<html>...</html>")
         value = cache.get("mykey", ttl=300)  # None if expired
         cache.delete("mykey")
         cache.clear()
     """
 
-    def __init__(self):
-        self._store: dict = {}
-        self._timestamps: dict = {}
+    def __init__(self, max_size: Optional[int] = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept, or None for no limit.
+        """
+        self.max_size = max_size
+        self._store: OrderedDict = OrderedDict()
 
     def get(self, key: str, ttl: Optional[int] = 300) -> Optional[Any]:
-        if key not in self._store:
+        entry = self._store.get(key)
+        if entry is None:
             return None
-        if ttl and key in self._timestamps and time.time() - self._timestamps[key] > ttl:
+        stored_at, value = entry
+        if ttl and time.time() - stored_at > ttl:
             self.delete(key)
             return None
-        return self._store[key]
+        if self.max_size is not None:
+            self._store.move_to_end(key)
+        return value
 
     def set(self, key: str, value: Any):
-        self._store[key] = value
-        self._timestamps[key] = time.time()
+        self._store[key] = (time.time(), value)
+        if self.max_size is not None:
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
 
     def delete(self, key: str):
         self._store.pop(key, None)
-        self._timestamps.pop(key, None)
 
     def clear(self):
         self._store.clear()
-        self._timestamps.clear()
@@ -1,17 +1,33 @@
+import logging
 import re
 
 from jinja2 import nodes
 from jinja2.ext import Extension
 from markupsafe import Markup
 
+from ..html_attrs import attrs_to_kwargs
 from .registry import ComponentRegistry
 
+logger = logging.getLogger(__name__)
+
+# Compiled once: preprocess() runs on every template (re)compilation.
+_SELF_CLOSING_RE = re.compile(r"<component\.(\w+)([^/]*)/>")
+_BLOCK_RE = re.compile(
+    r"<component\.(\w+)([^>]*)>((?:(?!<component\.).)*?)</component\.\1>", re.DOTALL
+)
+
 
 class ComponentExtension(Extension):
     """Handles {% component "name" key=value %} ... {% endcomponent %} tags."""
 
     tags = {"component"}
 
+    def __init__(self, environment):
+        super().__init__(environment)
+        # Compiled string components, keyed by source, so each one goes
+        # through Jinja2's lexer/parser/codegen once instead of per render.
+        self._compiled: dict = {}
+
     def parse(self, parser):
         lineno = next(parser.stream).lineno
         component_name = parser.parse_expression()
@@ -32,7 +48,7 @@ class ComponentExtension(Extension):
     async def _render_async(self, name: str, caller, **props):
         template = ComponentRegistry.get(name)
         if not template:
-            return f"<!-- Component '{name}' not found -->"
+            return Markup("<!-- Component '{}' not found -->").format(name)
         try:
             slot_content = await caller()
             slot = Markup(slot_content) if slot_content else Markup("")
@@ -44,62 +60,36 @@ class ComponentExtension(Extension):
                 template.children = slot
                 return template.render()
 
-            tpl = self.environment.from_string(template)
+            tpl = self._compiled.get(template)
+            if tpl is None:
+                tpl = self._compiled[template] = self.environment.from_string(template)
             return await tpl.render_async(**props)
         except Exception as e:
-            import traceback
-
-            traceback.print_exc()
-            return f"<!-- Error rendering component '{name}': {e} -->"
+            logger.exception("Error rendering component '%s'", name)
+            return Markup("<!-- Error rendering component '{}': {} -->").format(name, e)
 
 
 class ComponentExtensions(Extension):
     """Preprocessor: converts <component.X prop="v"> syntax to {% component %} tags."""
 
     def preprocess(self, source, name, filename=None):
+        if "<component." not in source:
+            return source
         return self._convert(source)
 
     def _convert(self, source: str) -> str:
-        def parse_props(props_str: str) -> str:
-            props = []
-            for match in re.findall(
-                r'(\w+)=(?:"([^"]*)"|\'([^\']*)\'|(\d+\.?\d*)|(\w+))', props_str
-            ):
-                key = match[0]
-                if match[1]:
-                    props.append(
-                        f'{key}="{match[1]}"' if "{{" not in match[1] else f"{key}={match[1]}"
-                    )
-                elif match[2]:
-                    props.append(
-                        f'{key}="{match[2]}"' if "{{" not in match[2] else f"{key}={match[2]}"
-                    )
-                elif match[3]:
-                    props.append(f"{key}={match[3]}")
-                elif match[4]:
-                    lower = match[4].lower()
-                    props.append(
-                        f"{key}={lower if lower in ('true','false','none','null') else match[4]}"
-                    )
-            return (" " + " ".join(props)) if props else ""
-
         # Self-closing
-        source = re.sub(
-            r"<component\.(\w+)([^/]*)/>",
-            lambda m: f'{{% component "{m.group(1)}"{parse_props(m.group(2))} %}}{{% endcomponent %}}',
+        source = _SELF_CLOSING_RE.sub(
+            lambda m: f'{{% component "{m.group(1)}"{attrs_to_kwargs(m.group(2))} %}}{{% endcomponent %}}',
             source,
         )
 
         # Block components (innermost-first loop)
-        pattern = re.compile(
-            r"<component\.(\w+)([^>]*)>((?:(?!<component\.).)*?)</component\.\1>", re.DOTALL
-        )
         prev = None
         while prev != source:
             prev = source
-            source = re.sub(
-                pattern,
-                lambda m: f'{{% component "{m.group(1)}"{parse_props(m.group(2))} %}}{m.group(3)}{{% endcomponent %}}',
+            source = _BLOCK_RE.sub(
+                lambda m: f'{{% component "{m.group(1)}"{attrs_to_kwargs(m.group(2))} %}}{m.group(3)}{{% endcomponent %}}',
                 source,
             )
 
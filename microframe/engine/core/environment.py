@@ -1,17 +1,16 @@
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from urllib.parse import urlencode
 
 import jinja2
-from markupsafe import Markup
 
 from ..cache import CacheManager
 from ..components import (ComponentExtension, ComponentExtensions,
                           auto_register_components)
-from ..filters import (filter_currency, filter_json_pretty, filter_slugify,
-                       filter_timeago, filter_truncate)
+from ..filters import (filter_currency, filter_json, filter_json_pretty,
+                       filter_slugify, filter_timeago, filter_truncate)
 from ..globals import breadcrumbs, generate_csrf_token, paginate
 from ..mfe import MFEClient
 from ..remote import (ActionExtension, HtmlRemoteActionExtension,
@@ -48,9 +47,6 @@ def build_environment(
     plugin contributing templates.
     """
 
-    cache_dir = Path(".jinja_cache")
-    cache_dir.mkdir(exist_ok=True)
-
     directories: List[str] = [directory] if isinstance(directory, str) else list(directory)
     for d in directories:
         auto_register_components(f"{d}/components")
@@ -77,6 +73,8 @@ def build_environment(
         autoescape=jinja2.select_autoescape(["html", "xml"]),
     )
     if bytecode_cache:
+        cache_dir = Path(".jinja_cache")
+        cache_dir.mkdir(exist_ok=True)
         options["bytecode_cache"] = jinja2.FileSystemBytecodeCache(str(cache_dir))
 
     env = jinja2.Environment(**options)  # type: ignore
@@ -93,7 +91,7 @@ def build_environment(
     def build_url(name: str, **params) -> str:
         url = f"/{name}"
         if params:
-            url += "?" + "&".join(f"{k}={v}" for k, v in params.items())
+            url += "?" + urlencode(params)
         return url
 
     env.globals.update(
@@ -110,7 +108,7 @@ def build_environment(
 
     env.filters.update(
         {
-            "json": lambda obj: Markup(json.dumps(obj, ensure_ascii=False)),
+            "json": filter_json,
             "json_pretty": filter_json_pretty,
             "truncate": filter_truncate,
             "slugify": filter_slugify,
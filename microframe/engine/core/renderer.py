@@ -6,9 +6,11 @@ import logging
 import re
 import secrets
 import time
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import (Any, AsyncIterator, Callable, Dict, List, Optional,
+                    Sequence, Tuple, Union)
 
 import jinja2
+from markupsafe import escape
 
 from ..cache import CacheBackend, CacheManager
 from ..mfe import MFEClient
@@ -16,6 +18,14 @@ from .environment import build_environment
 
 logger = logging.getLogger(__name__)
 
+# _minify() patterns, compiled once instead of on every render.
+_PROTECTED_RE = re.compile(r"<(pre|textarea|script)[\s\S]*?</\1>", re.IGNORECASE)
+_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_SPACES_RE = re.compile(r"[ \t]+")
+_BETWEEN_TAGS_RE = re.compile(r">\s+<")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+_PLACEHOLDER_RE = re.compile(r"___P(\d+)___")
+
 
 class TemplateEngine:
     _instance: Optional["TemplateEngine"] = None
@@ -44,7 +54,8 @@ class TemplateEngine:
         self._csrf_token = secrets.token_urlsafe(32)
         self.mfe = MFEClient(timeout=mfe_timeout)
 
-        self._context_processors: List[Callable] = []
+        # (processor, takes_ctx): the signature is inspected once at registration.
+        self._context_processors: List[Tuple[Callable, bool]] = []
 
         self.env = build_environment(
             directory=directory,
@@ -70,19 +81,7 @@ class TemplateEngine:
         use_cache: Optional[bool] = None,
     ) -> str:
         """Render a template and return the HTML string."""
-        ctx = dict(ctx or {})
-
-        for processor in self._context_processors:
-            sig = inspect.signature(processor)
-            params = list(sig.parameters.values())
-            if len(params) == 1:
-                result = processor(ctx)
-            else:
-                result = processor()
-            if asyncio.iscoroutine(result):
-                result = await result
-            if isinstance(result, dict):
-                ctx.update(result)
+        ctx = await self._build_context(ctx)
 
         cached_enabled = self.enable_cache if use_cache is None else use_cache
 
@@ -90,7 +89,7 @@ class TemplateEngine:
             key = self._cache_key(template_name, ctx)
             hit = await self._maybe_await(self._cache.get(key, self.cache_ttl))
             if hit:
-                logger.debug(f"Cache hit: {template_name}")
+                logger.debug("Cache hit: %s", template_name)
                 return hit
 
         try:
@@ -102,22 +101,42 @@ class TemplateEngine:
             if cached_enabled:
                 await self._maybe_await(self._cache.set(key, html))
 
-            logger.debug(f"Rendered {template_name} in {(time.time() - start) * 1000:.2f}ms")
+            logger.debug("Rendered %s in %.2fms", template_name, (time.time() - start) * 1000)
             return html
 
-        except jinja2.TemplateNotFound:
-            logger.error(f"Template not found: {template_name}")
-            return f"<h1>Template Error</h1><p>'{template_name}' not found</p>"
         except Exception as e:
-            logger.exception(f"Error rendering '{template_name}'")
-            return f"<h1>Render Error</h1><pre>{type(e).__name__}: {e}</pre>"
+            return self._error_page(template_name, e)
+
+    async def stream(
+        self, template_name: str, ctx: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Render a template chunk by chunk.
+
+        Yields HTML fragments as Jinja2 produces them, so an ASGI app can
+        start sending the page before it is fully rendered:
+
+            return StreamingResponse(engine.stream("page.html", ctx))
+
+        Minification and the render cache are skipped, since both need the
+        complete document. Unlike ``render()``, an error raised mid-template
+        cannot replace the page: the error page is appended after the HTML
+        already sent.
+        """
+        ctx = await self._build_context(ctx)
+        try:
+            template = self.env.get_template(template_name)
+            async for chunk in template.generate_async(**ctx):
+                yield chunk
+        except Exception as e:
+            yield self._error_page(template_name, e)
 
     # ------------------------------------------------------------------
     # Customization
     # ------------------------------------------------------------------
 
     def add_context_processor(self, func: Callable):
-        self._context_processors.append(func)
+        takes_ctx = len(inspect.signature(func).parameters) == 1
+        self._context_processors.append((func, takes_ctx))
 
     def add_global(self, name: str, value: Any):
         self.env.globals[name] = value
@@ -143,10 +162,45 @@ class TemplateEngine:
         await self._maybe_await(self._cache.clear())
         logger.info("Template cache cleared")
 
+    async def aclose(self):
+        """Close the pooled MFE HTTP client opened by ``async with engine``."""
+        await self.mfe.aclose()
+
+    async def __aenter__(self) -> "TemplateEngine":
+        await self.mfe.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    async def _build_context(self, ctx: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        ctx = dict(ctx or {})
+
+        for processor, takes_ctx in self._context_processors:
+            result = processor(ctx) if takes_ctx else processor()
+            if asyncio.iscoroutine(result):
+                result = await result
+            if isinstance(result, dict):
+                ctx.update(result)
+
+        return ctx
+
+    @staticmethod
+    def _error_page(template_name: str, exc: Exception) -> str:
+        """Log a render failure and return the HTML shown in place of the page.
+
+        Must be called from the ``except`` block so the traceback is logged.
+        """
+        if isinstance(exc, jinja2.TemplateNotFound):
+            logger.error("Template not found: %s", template_name)
+            return f"<h1>Template Error</h1><p>'{escape(template_name)}' not found</p>"
+        logger.exception("Error rendering '%s'", template_name)
+        return f"<h1>Render Error</h1><pre>{type(exc).__name__}: {escape(str(exc))}</pre>"
+
     @staticmethod
     async def _maybe_await(value: Any) -> Any:
         """Await `value` if the cache backend is async (e.g. XCoreCacheBackend),
@@ -168,14 +222,19 @@ class TemplateEngine:
             protected.append(match.group(0))
             return f"___P{len(protected) - 1}___"
 
-        html = re.sub(r"<(pre|textarea|script)[\s\S]*?</\1>", save, html, flags=re.IGNORECASE)
-        html = re.sub(r"<!--(?!\[if).*?-->", "", html, flags=re.DOTALL)
-        html = re.sub(r"[ \t]+", " ", html)
-        html = re.sub(r">\s+<", "><", html)
-        html = re.sub(r"\n\s*\n", "\n", html)
+        html = _PROTECTED_RE.sub(save, html)
+        html = _COMMENT_RE.sub("", html)
+        html = _SPACES_RE.sub(" ", html)
+        html = _BETWEEN_TAGS_RE.sub("><", html)
+        html = _BLANK_LINES_RE.sub("\n", html)
+
+        def restore(match):
+            # Literal "___P<n>___" text in the page has no saved block: keep it.
+            index = int(match.group(1))
+            return protected[index] if index < len(protected) else match.group(0)
 
-        for i, block in enumerate(protected):
-            html = html.replace(f"___P{i}___", block)
+        if protected:
+            html = _PLACEHOLDER_RE.sub(restore, html)
 
         return html.strip()
 
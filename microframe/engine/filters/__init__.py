@@ -1,10 +1,11 @@
-from .builtin import (filter_currency, filter_json_pretty, filter_slugify,
-                      filter_timeago, filter_truncate)
+from .builtin import (filter_currency, filter_json, filter_json_pretty,
+                      filter_slugify, filter_timeago, filter_truncate)
 
 __all__ = [
     "filter_truncate",
     "filter_slugify",
     "filter_currency",
     "filter_timeago",
+    "filter_json",
     "filter_json_pretty",
 ]
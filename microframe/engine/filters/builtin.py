@@ -1,8 +1,14 @@
 import json
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+from markupsafe import Markup
+
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_DASH_RE = re.compile(r"[-\s]+")
+
 
 def filter_truncate(text: str, length: int = 100, suffix: str = "...") -> str:
     """Truncate text at word boundary.
@@ -14,12 +20,16 @@ def filter_truncate(text: str, length: int = 100, suffix: str = "...") -> str:
     return text[:length].rsplit(" ", 1)[0] + suffix
 
 
+@lru_cache(maxsize=1024)
 def filter_slugify(text: str) -> str:
     """Convert text to a URL-friendly slug.
 
+    Memoized: the same titles are typically slugified on every render of a
+    listing page.
+
     Usage in template: ``{{ title|slugify }}``
     """
-    return re.sub(r"[-\s]+", "-", re.sub(r"[^\w\s-]", "", text.lower().strip()))
+    return _SLUG_DASH_RE.sub("-", _SLUG_STRIP_RE.sub("", text.lower().strip()))
 
 
 def filter_currency(value: float, symbol: str = "$", decimals: int = 2) -> str:
@@ -51,6 +61,14 @@ def filter_timeago(dt: datetime) -> str:
             return ""
 
 
+def filter_json(obj: Any) -> Markup:
+    """Serialize an object as inline JSON, marked safe.
+
+    Usage in template: ``<script>const data = {{ data|json }};</script>``
+    """
+    return Markup(json.dumps(obj, ensure_ascii=False))
+
+
 def filter_json_pretty(obj: Any) -> str:
     """Format an object as indented JSON.
 
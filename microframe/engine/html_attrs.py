@@ -0,0 +1,37 @@
+"""HTML-style attribute parsing shared by the template preprocessors.
+
+Both ``<component.X ...>`` and ``<remote ...>``/``<action ...>`` tags carry
+attributes written as HTML, which are rewritten to Jinja2 keyword arguments.
+"""
+
+import re
+
+# Compiled once: preprocessors run on every template (re)compilation.
+_ATTR_RE = re.compile(r'(\w+)=(?:"([^"]*)"|\'([^\']*)\'|(\d+\.?\d*)|(\w+))')
+_LITERALS = frozenset(("true", "false", "none", "null"))
+
+
+def attrs_to_kwargs(attrs_str: str, quote_words: bool = False) -> str:
+    """Convert HTML-style attributes to Jinja2 keyword arguments.
+
+    Quoted values become strings, unless they contain ``{{`` (passed through
+    as an expression). Numbers and ``true``/``false``/``none``/``null`` are
+    Jinja2 literals. Other bare words are variable names, or strings when
+    ``quote_words`` is set.
+
+    Returns the arguments with a leading space, or ``""`` if there are none.
+    """
+    kwargs = []
+    for key, double_quoted, single_quoted, number, word in _ATTR_RE.findall(attrs_str):
+        quoted = double_quoted or single_quoted
+        if quoted:
+            kwargs.append(f'{key}="{quoted}"' if "{{" not in quoted else f"{key}={quoted}")
+        elif number:
+            kwargs.append(f"{key}={number}")
+        elif word:
+            lower = word.lower()
+            if lower in _LITERALS:
+                kwargs.append(f"{key}={lower}")
+            else:
+                kwargs.append(f'{key}="{word}"' if quote_words else f"{key}={word}")
+    return (" " + " ".join(kwargs)) if kwargs else ""
@@ -110,10 +110,14 @@ class TemplateEngineExtension(BaseService):
 
     async def init(self) -> None:
         self.engine = TemplateEngine(**self._config)
+        # Keep-alive connections to MFE services are pooled for the app's lifetime.
+        await self.engine.mfe.open()
         if ServiceStatus is not None:
             self._status = ServiceStatus.READY
 
     async def shutdown(self) -> None:
+        if self.engine is not None:
+            await self.engine.aclose()
         if ServiceStatus is not None:
             self._status = ServiceStatus.STOPPED
 
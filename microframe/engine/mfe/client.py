@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 import httpx
 from markupsafe import Markup
@@ -12,22 +13,35 @@ class MFEClient:
 
     Fetches HTML fragments from external HTTP services at render time.
     Fragments are fetched concurrently (per-template) and errors produce
-    HTML comments instead of breaking the page.
+    HTML comments instead of breaking the page. Between ``open()`` and
+    ``aclose()`` (or inside ``async with``) a single pooled
+    ``httpx.AsyncClient`` is reused, so keep-alive connections to fragment
+    services survive from one render to the next. Outside that scope each
+    fetch uses a short-lived client.
 
     Usage:
         client = MFEClient(timeout=5.0)
         client.register("header", "http://header-service/fragment")
-        html = await client.fetch("header", user_id=42)
+        async with client:
+            html = await client.fetch("header", user_id=42)
     """
 
-    def __init__(self, timeout: float = 5.0):
+    def __init__(self, timeout: float = 5.0, transport: Optional[httpx.AsyncBaseTransport] = None):
         """Initialize the MFE client.
 
         Args:
             timeout: HTTP request timeout in seconds.
+            transport: Optional httpx transport shared by every fetch, e.g.
+                ``httpx.ASGITransport(app=fragments_app)`` to serve fragments
+                in-process without a network hop, or ``httpx.MockTransport``
+                in tests. It stays owned by the caller: neither fetches nor
+                ``aclose()`` close it.
         """
         self.timeout = timeout
+        self.transport = transport
         self._registry: Dict[str, str] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def register(self, name: str, url: str):
         """Register a micro-frontend fragment URL.
@@ -37,7 +51,7 @@ class MFEClient:
             url: Full URL to the fragment endpoint.
         """
         self._registry[name] = url
-        logger.info(f"MFE '{name}' -> {url}")
+        logger.info("MFE '%s' -> %s", name, url)
 
     def register_many(self, mfes: Dict[str, str]):
         """Register multiple micro-frontends at once.
@@ -48,7 +62,7 @@ class MFEClient:
         for name, url in mfes.items():
             self.register(name, url)
 
-    async def fetch(self, name: str, **kwargs) -> str:
+    async def fetch(self, name: str, **kwargs) -> Markup:
         """Fetch a micro-frontend fragment.
 
         Sends a GET request to the registered URL with kwargs as query
@@ -60,24 +74,69 @@ class MFEClient:
             **kwargs: Query parameters forwarded to the fragment URL.
 
         Returns:
-            The fragment HTML (Markup safe), or a comment on error.
+            The fragment HTML (Markup safe), or a Markup comment on error.
         """
         url = self._registry.get(name)
         if not url:
-            logger.warning(f"MFE '{name}' not registered")
-            return f"<!-- MFE '{name}' not found -->"
+            logger.warning("MFE '%s' not registered", name)
+            return Markup("<!-- MFE '{}' not found -->").format(name)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=kwargs)
-                response.raise_for_status()
-                return Markup(response.text)
+            response = await self._get(url, kwargs)
+            response.raise_for_status()
+            return Markup(response.text)
         except httpx.TimeoutException:
-            logger.error(f"MFE '{name}' timeout after {self.timeout}s")
-            return f"<!-- MFE '{name}' timeout -->"
+            logger.error("MFE '%s' timeout after %ss", name, self.timeout)
+            return Markup("<!-- MFE '{}' timeout -->").format(name)
         except httpx.HTTPError as e:
-            logger.error(f"MFE '{name}' HTTP error: {e}")
-            return f"<!-- MFE '{name}' error: {e} -->"
+            logger.error("MFE '%s' HTTP error: %s", name, e)
+            return Markup("<!-- MFE '{}' error: {} -->").format(name, e)
         except Exception:
-            logger.exception(f"MFE '{name}' unexpected error")
-            return f"<!-- MFE '{name}' error -->"
+            logger.exception("MFE '%s' unexpected error", name)
+            return Markup("<!-- MFE '{}' error -->").format(name)
+
+    async def open(self) -> "MFEClient":
+        """Open the pooled HTTP client, reused by every fetch until ``aclose()``.
+
+        Connections belong to the event loop that opened them: call this from
+        the long-lived loop serving requests (e.g. an ASGI lifespan). Fetches
+        running on any other loop fall back to a short-lived client.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout, transport=self.transport)
+            self._client_loop = asyncio.get_running_loop()
+        return self
+
+    async def aclose(self):
+        """Close the pooled HTTP client and its keep-alive connections.
+
+        An injected ``transport`` is left open for its owner to close.
+        """
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        # Closing an httpx client closes its transport, which the caller owns.
+        if client is None or self.transport is not None:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            logger.warning("MFE client opened on another event loop; call aclose() from it")
+
+    async def __aenter__(self) -> "MFEClient":
+        return await self.open()
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _get(self, url: str, params: dict) -> httpx.Response:
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            return await self._client.get(url, params=params)
+
+        client = httpx.AsyncClient(timeout=self.timeout, transport=self.transport)
+        try:
+            return await client.get(url, params=params)
+        finally:
+            # Same ownership rule as aclose(): never close an injected transport.
+            if self.transport is None:
+                await client.aclose()
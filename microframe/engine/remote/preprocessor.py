@@ -1,25 +1,30 @@
 import re
+from typing import Callable
 
 from jinja2.ext import Extension
 
+from ..html_attrs import attrs_to_kwargs
 
-def _parse_attrs(attrs_str: str) -> str:
-    """Convert HTML-style attributes to Jinja2 keyword arguments."""
-    result = []
-    for m in re.finditer(r'(\w+)=(?:"([^"]*)"|\'([^\']*)\'|(\d+\.?\d*)|(\w+))', attrs_str):
-        key = m.group(1)
-        if m.group(2):
-            val = m.group(2)
-            result.append(f'{key}="{val}"' if "{{" not in val else f"{key}={val}")
-        elif m.group(3):
-            val = m.group(3)
-            result.append(f'{key}="{val}"' if "{{" not in val else f"{key}={val}")
-        elif m.group(4):
-            result.append(f"{key}={m.group(4)}")
-        elif m.group(5):
-            lower = m.group(5).lower()
-            result.append(key + ("=" + lower if lower in ("true", "false", "none", "null") else f'="{m.group(5)}"'))
-    return " " + " ".join(result) if result else ""
+# Compiled once: preprocess() runs on every template (re)compilation.
+_SELF_CLOSING_RES = tuple(
+    (tag, re.compile(rf"<{tag}\s+name=(\"[^\"]*\"|'[^']*')([^>]*?)\s*/>"))
+    for tag in ("remote", "action")
+)
+_BLOCK_RES = tuple(
+    (tag, re.compile(rf"<{tag}\s+name=(\"[^\"]*\"|'[^']*')([^>]*)>(.*?)</{tag}>", re.DOTALL))
+    for tag in ("remote", "action")
+)
+
+
+def _to_tag(tag: str) -> Callable[["re.Match[str]"], str]:
+    """Build the ``re.sub`` replacement turning a matched ``<tag>`` into its Jinja2 block."""
+
+    def replace(m: "re.Match[str]") -> str:
+        body = m.group(3) if m.re.groups > 2 else ""
+        kwargs = attrs_to_kwargs(m.group(2), quote_words=True)
+        return f"{{% {tag} {m.group(1)}{kwargs} %}}{body}{{% end{tag} %}}"
+
+    return replace
 
 
 class HtmlRemoteActionExtension(Extension):
@@ -32,6 +37,8 @@ class HtmlRemoteActionExtension(Extension):
     """
 
     def preprocess(self, source, name, filename=None):
+        if "<remote" not in source and "<action" not in source:
+            return source
         return self._convert(source)
 
     def _convert(self, source: str) -> str:
@@ -42,34 +49,18 @@ class HtmlRemoteActionExtension(Extension):
     @staticmethod
     def _convert_self_closing(source: str) -> str:
         """<remote name="x" /> → {% remote "x" %}{% endremote %}"""
-        source = re.sub(
-            r"<remote\s+name=(\"[^\"]*\"|'[^']*')([^>]*?)\s*/>",
-            lambda m: '{% remote ' + m.group(1) + _parse_attrs(m.group(2)) + ' %}{% endremote %}',
-            source,
-        )
-        source = re.sub(
-            r"<action\s+name=(\"[^\"]*\"|'[^']*')([^>]*?)\s*/>",
-            lambda m: '{% action ' + m.group(1) + _parse_attrs(m.group(2)) + ' %}{% endaction %}',
-            source,
-        )
+        for tag_name, pattern in _SELF_CLOSING_RES:
+            source = pattern.sub(_to_tag(tag_name), source)
         return source
 
     @staticmethod
     def _convert_block(source: str) -> str:
         """<remote name="x">body</remote> → {% remote "x" %}body{% endremote %}"""
 
-        for tag_name in ("remote", "action"):
-            pattern = re.compile(
-                rf"<{tag_name}\s+name=(\"[^\"]*\"|'[^']*')([^>]*)>(.*?)</{tag_name}>",
-                re.DOTALL,
-            )
+        for tag_name, pattern in _BLOCK_RES:
+            replace = _to_tag(tag_name)
             prev = None
             while prev != source:
                 prev = source
-                source = re.sub(
-                    pattern,
-                    lambda m, t=tag_name: '{% ' + t + ' ' + m.group(1) + _parse_attrs(m.group(2))
-                    + ' %}' + m.group(3) + '{% end' + t + ' %}',
-                    source,
-                )
+                source = pattern.sub(replace, source)
         return source
@@ -2,6 +2,41 @@ from jinja2 import nodes
 from jinja2.ext import Extension
 from markupsafe import Markup, escape
 
+# <action> keyword -> HTMX attribute forwarded onto the generated <form>.
+_HTMX_ATTRIBUTES = (
+    ("hx_target", "hx-target"),
+    ("hx_swap", "hx-swap"),
+    ("hx_trigger", "hx-trigger"),
+    ("hx_push_url", "hx-push-url"),
+    ("hx_select", "hx-select"),
+    ("hx_select_oob", "hx-select-oob"),
+    ("hx_confirm", "hx-confirm"),
+    ("hx_on", "hx-on"),
+)
+
+
+def _parse_call_block(extension: Extension, parser, end_tag: str, method: str) -> nodes.Node:
+    """Parse ``{% tag "name" key=value %}body{% end_tag %}`` into a CallBlock.
+
+    Shared by the ``remote`` and ``action`` tags, which only differ by their
+    closing tag and the extension method called at render time.
+    """
+    lineno = next(parser.stream).lineno
+    name = parser.parse_expression()
+
+    props = []
+    while parser.stream.current.type != "block_end":
+        key = parser.parse_assign_target()
+        parser.stream.expect("assign")
+        value = parser.parse_expression()
+        props.append(nodes.Keyword(key.name, value))
+
+    body = parser.parse_statements((f"name:{end_tag}",), drop_needle=True)
+
+    return nodes.CallBlock(
+        extension.call_method(method, [name], props), [], [], body
+    ).set_lineno(lineno)
+
 
 class RemoteExtension(Extension):
     """Handles {% remote "plugin.action" key=val %}...{% endremote %} tags.
@@ -13,21 +48,7 @@ class RemoteExtension(Extension):
     tags = {"remote"}
 
     def parse(self, parser):
-        lineno = next(parser.stream).lineno
-        name = parser.parse_expression()
-
-        props = []
-        while parser.stream.current.type != "block_end":
-            key = parser.parse_assign_target()
-            parser.stream.expect("assign")
-            value = parser.parse_expression()
-            props.append(nodes.Keyword(key.name, value))
-
-        body = parser.parse_statements(("name:endremote",), drop_needle=True)
-
-        return nodes.CallBlock(
-            self.call_method("_render", [name], props), [], [], body
-        ).set_lineno(lineno)
+        return _parse_call_block(self, parser, "endremote", "_render")
 
     async def _render(self, name: str, caller, **kwargs) -> str:
         caller_func = self.environment.globals.get("_remote_caller")
@@ -38,7 +59,7 @@ class RemoteExtension(Extension):
 
         body = await caller()
         fallback = body.strip() if body else ""
-        return fallback or f"<!-- remote '{name}' not available -->"
+        return fallback or Markup("<!-- remote '{}' not available -->").format(name)
 
 
 class ActionExtension(Extension):
@@ -50,21 +71,7 @@ class ActionExtension(Extension):
     tags = {"action"}
 
     def parse(self, parser):
-        lineno = next(parser.stream).lineno
-        name = parser.parse_expression()
-
-        props = []
-        while parser.stream.current.type != "block_end":
-            key = parser.parse_assign_target()
-            parser.stream.expect("assign")
-            value = parser.parse_expression()
-            props.append(nodes.Keyword(key.name, value))
-
-        body = parser.parse_statements(("name:endaction",), drop_needle=True)
-
-        return nodes.CallBlock(
-            self.call_method("_render_form", [name], props), [], [], body
-        ).set_lineno(lineno)
+        return _parse_call_block(self, parser, "endaction", "_render_form")
 
     async def _render_form(self, name: str, caller, **kwargs) -> str:
         resolver = self.environment.globals.get("_action_resolver")
@@ -76,8 +83,9 @@ class ActionExtension(Extension):
         htmx = self._build_htmx(kwargs)
         token = escape(csrf_fn() if csrf_fn else "")
 
-        if kwargs.get("hx_post") or kwargs.get("hx_get"):
-            hx_verb = "hx-get" if kwargs.get("hx_get") else "hx-post"
+        hx_get = kwargs.get("hx_get")
+        if hx_get or kwargs.get("hx_post"):
+            hx_verb = "hx-get" if hx_get else "hx-post"
             htmx += f' {hx_verb}="{url}"'
 
         body = await caller()
@@ -91,19 +99,8 @@ class ActionExtension(Extension):
 
     @staticmethod
     def _build_htmx(kwargs: dict) -> str:
-        mapping = {
-            "hx_target": "hx-target",
-            "hx_swap": "hx-swap",
-            "hx_trigger": "hx-trigger",
-            "hx_push_url": "hx-push-url",
-            "hx_select": "hx-select",
-            "hx_select_oob": "hx-select-oob",
-            "hx_confirm": "hx-confirm",
-            "hx_on": "hx-on",
-        }
-        attrs = []
-        for py_key, html_key in mapping.items():
-            val = kwargs.get(py_key)
-            if val:
-                attrs.append(f'{html_key}="{escape(val)}"')
-        return " " + " ".join(attrs) if attrs else ""
+        return "".join(
+            f' {html_key}="{escape(kwargs[py_key])}"'
+            for py_key, html_key in _HTMX_ATTRIBUTES
+            if kwargs.get(py_key)
+        )
@@ -18,14 +18,14 @@ def render_microui(component_name: str, **kwargs) -> Markup:
     """
     component_cls = ComponentRegistry.get(component_name.lower())
     if not component_cls:
-        return Markup(f"<!-- microui '{component_name}' not found -->")
+        return Markup("<!-- microui '{}' not found -->").format(component_name)
 
     instance = component_cls()
-    instance.props = dict(kwargs)
+    instance.props = kwargs
     instance.children = kwargs.get("children")
 
     html = instance.render()
-    return Markup(html)
+    return html if isinstance(html, Markup) else Markup(html)
 
 
 def setup_microui(env):
@@ -0,0 +1,27 @@
+from microframe import CacheManager
+
+
+def test_cache_manager_expires_entries(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("microframe.engine.cache.manager.time.time", lambda: clock[0])
+
+    cache = CacheManager()
+    cache.set("page", "<p>hi</p>")
+    assert cache.get("page", ttl=10) == "<p>hi</p>"
+
+    clock[0] += 11
+    assert cache.get("page", ttl=10) is None
+    assert cache.get("page", ttl=None) is None
+
+
+def test_cache_manager_evicts_least_recently_used():
+    cache = CacheManager(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import importlib.util
+
+import pytest
+
+from microframe.cli import _cmd_build, _scaffold_py_component
+from microframe.engine.ui import ComponentRegistry as UIComponentRegistry
+
+
+def _build_args(src, out):
+    return argparse.Namespace(dir=str(src), out=str(out), ctx=None, no_minify=True)
+
+
+def test_build_renders_every_page_in_template_order(tmp_path, capsys):
+    src = tmp_path / "templates"
+    (src / "blog").mkdir(parents=True)
+    (src / "base.html").write_text("<title>{% block title %}{% endblock %}</title>")
+    (src / "index.html").write_text('{% extends "base.html" %}{% block title %}Home{% endblock %}')
+    (src / "blog" / "post.html").write_text("<p>{{ 6 * 7 }}</p>")
+    (src / "notes.txt").write_text("not a page")
+
+    asyncio.run(_cmd_build(_build_args(src, tmp_path / "dist")))
+
+    dist = tmp_path / "dist"
+    assert (dist / "index.html").read_text() == "<title>Home</title>"
+    assert (dist / "blog" / "post.html").read_text() == "<p>42</p>"
+    assert not (dist / "notes.txt").exists()
+    built = [line.split()[1] for line in capsys.readouterr().out.splitlines()]
+    assert built == ["base.html", "blog/post.html", "index.html"]
+
+
+def test_build_reports_failed_pages_after_building_the_others(tmp_path, capsys):
+    src = tmp_path / "templates"
+    src.mkdir()
+    for name in ("a.html", "b.html", "c.html"):
+        (src / name).write_text(name)
+    # A directory in the way makes writing b.html fail.
+    (tmp_path / "dist" / "b.html").mkdir(parents=True)
+
+    with pytest.raises(SystemExit, match="1 page"):
+        asyncio.run(_cmd_build(_build_args(src, tmp_path / "dist")))
+
+    assert (tmp_path / "dist" / "a.html").read_text() == "a.html"
+    assert (tmp_path / "dist" / "c.html").read_text() == "c.html"
+    assert "failed b.html" in capsys.readouterr().err
+
+
+def test_scaffolded_py_component_renders_its_slot(tmp_path, monkeypatch):
+    # Importing the scaffold registers it: keep the process-global registry untouched.
+    monkeypatch.setattr(UIComponentRegistry, "_components", {})
+    _scaffold_py_component("user_card", str(tmp_path / "components"))
+
+    spec = importlib.util.spec_from_file_location(
+        "user_card", tmp_path / "components" / "user_card.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    component = module.UserCard()
+    component.props = {"slot": "Hello"}
+    assert component.render() == '<div class="user_card">Hello</div>'
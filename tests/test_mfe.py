@@ -0,0 +1,97 @@
+import asyncio
+
+import httpx
+from markupsafe import Markup
+
+from microframe import MFEClient
+
+
+class RecordingTransport(httpx.MockTransport):
+    closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_mfe_client_reuses_its_http_client_and_transport():
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(200, text=f"<nav>{request.url.params['user']}</nav>")
+
+    transport = RecordingTransport(handler)
+    client = MFEClient(transport=transport)
+    client.register("header", "http://fragments/header")
+
+    async def fetch_twice():
+        async with client:
+            first = await client.fetch("header", user="a")
+            http_client = client._client
+            second = await client.fetch("header", user="b")
+            assert client._client is http_client
+        assert client._client is None
+        return first, second
+
+    assert asyncio.run(fetch_twice()) == ("<nav>a</nav>", "<nav>b</nav>")
+    assert seen == ["http://fragments/header?user=a", "http://fragments/header?user=b"]
+    # The injected transport belongs to the caller and is never closed by MFEClient.
+    assert not transport.closed
+
+
+def test_mfe_client_without_open_pool_keeps_no_client_across_loops():
+    transport = RecordingTransport(lambda request: httpx.Response(200, text="ok"))
+    client = MFEClient(transport=transport)
+    client.register("nav", "http://fragments/nav")
+
+    for _ in range(3):
+        assert asyncio.run(client.fetch("nav")) == "ok"
+        assert client._client is None
+    assert not transport.closed
+
+
+def test_mfe_client_reports_http_errors_as_comments():
+    client = MFEClient(transport=httpx.MockTransport(lambda request: httpx.Response(500)))
+    client.register("cart", "http://fragments/cart")
+
+    html = asyncio.run(client.fetch("cart"))
+
+    assert isinstance(html, Markup)
+    assert html.startswith("<!-- MFE 'cart' error:")
+    missing = asyncio.run(client.fetch("missing"))
+    assert missing == Markup("<!-- MFE 'missing' not found -->")
+
+
+def test_mfe_fallback_comment_cannot_be_closed_by_the_name():
+    html = asyncio.run(MFEClient().fetch("--><script>alert(1)</script>"))
+
+    assert "-->" not in html[:-3] and "<script>" not in html
+    assert html.startswith("<!-- MFE") and html.endswith("not found -->")
+
+
+def test_xcore_extension_pools_mfe_client_between_init_and_shutdown(tmp_path, monkeypatch):
+    from microframe.engine.integration.xcore import TemplateEngineExtension
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text="<nav></nav>"))
+    created = []
+    async_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        kwargs["transport"] = transport
+        created.append(async_client(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(httpx, "AsyncClient", make_client)
+    extension = TemplateEngineExtension({"directory": str(tmp_path)})
+
+    async def lifecycle():
+        await extension.init()
+        extension.engine.mfe.register("nav", "http://fragments/nav")
+        first = await extension.engine.mfe.fetch("nav")
+        second = await extension.engine.mfe.fetch("nav")
+        await extension.shutdown()
+        return first, second
+
+    assert asyncio.run(lifecycle()) == ("<nav></nav>", "<nav></nav>")
+    assert len(created) == 1
+    assert created[0].is_closed
@@ -54,3 +54,10 @@ def test_action_extension_escapes_html_attributes(tmp_path):
     assert "<img src=x onerror=1>" not in html
     assert "<svg/onload=1>" not in html
     assert "<button>Save</button>" in html
+
+
+def test_missing_microui_component_name_is_escaped():
+    html = str(render_microui("--><script>alert(1)</script>"))
+
+    assert "<script>" not in html
+    assert html.startswith("<!-- microui") and html.endswith("not found -->")
@@ -0,0 +1,120 @@
+import asyncio
+
+from microframe import TemplateEngine
+
+
+def test_minify_restores_every_protected_block(tmp_path):
+    blocks = "".join(f"<pre>  block {i}  </pre>\n\n" for i in range(12))
+    (tmp_path / "page.html").write_text(f"<div>\n   {blocks}<p>see ___P12___</p></div>")
+
+    engine = TemplateEngine(directory=str(tmp_path))
+    html = asyncio.run(engine.render("page.html", {}))
+
+    for i in range(12):
+        assert f"<pre>  block {i}  </pre>" in html
+    assert "<p>see ___P12___</p>" in html
+    assert html.count("___P") == 1
+
+
+def test_stream_yields_same_html_as_render(tmp_path):
+    (tmp_path / "list.html").write_text(
+        "<ul>{% for item in items %}<li>{{ item }}</li>{% endfor %}</ul>"
+    )
+    engine = TemplateEngine(directory=str(tmp_path), enable_minify=False)
+    engine.add_context_processor(lambda: {"items": ["a", "b"]})
+
+    async def collect():
+        return [chunk async for chunk in engine.stream("list.html")]
+
+    chunks = asyncio.run(collect())
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == asyncio.run(engine.render("list.html"))
+
+
+def test_string_components_are_compiled_once(tmp_path, monkeypatch):
+    from microframe import ComponentRegistry
+
+    # setitem removes the entry again at teardown: the registry is process-global.
+    monkeypatch.setitem(
+        ComponentRegistry._components, "badge_once", "<b>{{ label }}:{{ slot }}</b>"
+    )
+    (tmp_path / "page.html").write_text(
+        '{% for i in range(3) %}{% component "badge_once" label=i %}x{% endcomponent %}'
+        "{% endfor %}"
+    )
+    engine = TemplateEngine(directory=str(tmp_path))
+
+    compiled = []
+    from_string = engine.env.from_string
+    monkeypatch.setattr(
+        engine.env, "from_string", lambda source: compiled.append(source) or from_string(source)
+    )
+
+    assert asyncio.run(engine.render("page.html")) == "<b>0:x</b><b>1:x</b><b>2:x</b>"
+    assert asyncio.run(engine.render("page.html")) == "<b>0:x</b><b>1:x</b><b>2:x</b>"
+    assert len(compiled) == 1
+
+
+def test_render_error_page_escapes_exception_message(tmp_path):
+    (tmp_path / "boom.html").write_text("{{ fail() }}")
+
+    def fail():
+        raise ValueError("<script>alert(1)</script>")
+
+    engine = TemplateEngine(directory=str(tmp_path))
+    html = asyncio.run(engine.render("boom.html", {"fail": fail}))
+
+    assert "<script>" not in html
+    assert "ValueError: &lt;script&gt;" in html
+
+
+def test_stream_appends_error_page_after_sent_chunks(tmp_path):
+    (tmp_path / "boom.html").write_text("<p>ok</p>{{ fail() }}")
+
+    def fail():
+        raise ValueError("<b>")
+
+    engine = TemplateEngine(directory=str(tmp_path))
+
+    async def collect():
+        return [chunk async for chunk in engine.stream("boom.html", {"fail": fail})]
+
+    chunks = asyncio.run(collect())
+
+    assert chunks[0] == "<p>ok</p>"
+    assert chunks[-1] == "<h1>Render Error</h1><pre>ValueError: &lt;b&gt;</pre>"
+    assert chunks[-1] == asyncio.run(engine.render("boom.html", {"fail": fail}))
+
+
+def test_bytecode_cache_dir_is_only_created_when_enabled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    TemplateEngine(directory=str(tmp_path), debug=False)
+    assert not (tmp_path / ".jinja_cache").exists()
+
+    engine = TemplateEngine(directory=str(tmp_path), debug=False, bytecode_cache=True)
+    assert (tmp_path / ".jinja_cache").is_dir()
+    assert engine.env.auto_reload is False
+
+
+def test_url_global_encodes_query_parameters(tmp_path):
+    engine = TemplateEngine(directory=str(tmp_path))
+    build_url = engine.env.globals["url"]
+
+    assert build_url("search") == "/search"
+    assert build_url("search", q="a&b=c", page=2) == "/search?q=a%26b%3Dc&page=2"
+
+
+def test_context_processors_with_and_without_ctx(tmp_path):
+    (tmp_path / "page.html").write_text("{{ a }}-{{ b }}-{{ c }}")
+    engine = TemplateEngine(directory=str(tmp_path))
+    engine.add_context_processor(lambda: {"a": 1})
+    engine.add_context_processor(lambda ctx: {"b": ctx["a"] + 1})
+
+    async def later(ctx):
+        return {"c": ctx["b"] + 1}
+
+    engine.add_context_processor(later)
+
+    assert asyncio.run(engine.render("page.html")) == "1-2-3"